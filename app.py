@@ -1,25 +1,53 @@
 import streamlit as st
+import asyncio
+import atexit
 import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from google_news_rss import fetch_google_news, fetch_all_categories
-from utils import summarize_headlines, summarize_headlines_stream
+from utils import (
+    compact_headlines,
+    summarize_headlines_stream,
+    summarize_all,
+    truncate_text
+)
 from cache_manager import (
-    add_search_to_cache, 
+    stream_search_to_cache,
     get_recent_searches, 
     get_search_by_query,
     clear_cache,
     get_category_from_cache,
-    save_category_to_cache,
+    save_categories_to_cache,
     update_category_summary,
     get_all_categories_from_cache,
     clear_category_cache
 )
+from ui import get_category_emoji, init_session_state, render_headlines_list
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+@st.cache_resource(show_spinner=False)
+def configure_logging():
+    """
+    Send log records through a queue drained by a background listener, so
+    Streamlit reruns never block on log output. Cached so the listener is
+    started once per process rather than on every rerun.
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    return listener
+
+configure_logging()
 
 # ===========================================
 # Categories Configuration
@@ -45,81 +73,145 @@ st.set_page_config(
 # ===========================================
 # Session State Initialization
 # ===========================================
-if 'current_data' not in st.session_state:
-    st.session_state.current_data = None  # Custom search data (shown as dynamic tab)
-if 'pending_search' not in st.session_state:
-    st.session_state.pending_search = None  # {query, days} - triggers search inside tab
-if 'category_data' not in st.session_state:
-    st.session_state.category_data = {}  # {category: {headlines, summary, timestamp}}
-if 'fetch_triggered' not in st.session_state:
-    st.session_state.fetch_triggered = False
-if 'last_refresh' not in st.session_state:
-    st.session_state.last_refresh = None
+init_session_state()
 
 # ===========================================
 # Cache-First Load Strategy
 # ===========================================
+def add_display_fields(headlines):
+    """
+    Copy headlines with the dashboard's truncated title precomputed.
+
+    Returns new dicts so headlines shared with the cache layer are never
+    modified.
+    """
+    return [dict(headline, title_80=truncate_text(headline['title'], 80)) for headline in headlines]
+
+def add_query_labels(search):
+    """Precompute the truncated query labels for the sidebar and tab title."""
+    search['query_25'] = truncate_text(search['query'], 25)
+    search['query_20'] = truncate_text(search['query'], 20)
+    return search
+
 def load_categories_from_cache():
     """Load all categories from cache into session state."""
     cached_categories = get_all_categories_from_cache()
     for category, data in cached_categories.items():
         if category not in st.session_state.category_data:
+            data['headlines'] = add_display_fields(data['headlines'])
             st.session_state.category_data[category] = data
     return cached_categories
 
+@st.cache_data(ttl=60, show_spinner=False)
+def load_recent_searches(limit: int = 5):
+    """Recent searches for the sidebar, memoized across reruns."""
+    return [add_query_labels(dict(search)) for search in get_recent_searches(limit=limit)]
+
+class _NotCached(Exception):
+    """Carries a result out of an st.cache_data function without memoizing it."""
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+def _call_cached(fetch, *args):
+    """Call a memoized fetch, returning results it refused to cache as well."""
+    try:
+        return fetch(*args)
+    except _NotCached as e:
+        return e.result
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_fetch(query: str, days: int):
+    """fetch_google_news memoized for 10 minutes across reruns and sessions."""
+    headlines = fetch_google_news(query, days=days, verbose=False)
+    if not headlines:
+        # [] also means the fetch failed; don't pin that for 10 minutes
+        raise _NotCached(headlines)
+    return headlines
+
+def _fetch_categories(categories: tuple, days: int, refresh: bool = False):
+    """Fetch the given categories concurrently on one asyncio event loop."""
+    return fetch_all_categories(
+        {category: CATEGORIES[category] for category in categories},
+        days=days,
+        refresh=refresh
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_fetch_categories(categories: tuple, days: int):
+    """_fetch_categories memoized for 10 minutes, unless a category came back empty."""
+    fresh_data = _fetch_categories(categories, days)
+    if not all(fresh_data.values()):
+        raise _NotCached(fresh_data)
+    return fresh_data
+
+def fetch_categories(categories, days: int = 7, cached: bool = False):
+    """
+    Fetch headlines for the given categories concurrently.
+
+    Results are written to session state and the cache from the script
+    thread. With cached=True, a fetch of the same categories made within the
+    last 10 minutes is reused instead of hitting the network again; otherwise
+    every feed is fetched fresh, bypassing the RSS module's one-minute memo.
+    """
+    if not categories:
+        return {}
+
+    if cached:
+        fresh_data = _call_cached(_cached_fetch_categories, tuple(categories), days)
+    else:
+        fresh_data = _fetch_categories(tuple(categories), days, refresh=True)
+
+    fetched = {category: headlines for category, headlines in fresh_data.items() if headlines}
+
+    # Save to cache in one write for the whole batch, before any UI-only
+    # fields are added
+    save_categories_to_cache(fetched)
+
+    for category, headlines in fetched.items():
+        # Update session state
+        st.session_state.category_data[category] = {
+            'headlines': add_display_fields(headlines),
+            'summary': None,  # Summary generated on-demand
+            'timestamp': time.time(),
+            'num_articles': len(headlines)
+        }
+
+    return fresh_data
+
 def fetch_fresh_categories(days: int = 7):
     """Fetch fresh data for all categories in parallel."""
     logging.info("Fetching fresh data for all categories...")
-    fresh_data = fetch_all_categories(CATEGORIES, days=days)
-    
-    for category, headlines in fresh_data.items():
-        if headlines:
-            # Update session state
-            st.session_state.category_data[category] = {
-                'headlines': headlines,
-                'summary': None,  # Summary generated on-demand
-                'timestamp': datetime.now().isoformat(),
-                'num_articles': len(headlines)
-            }
-            # Save to cache
-            save_category_to_cache(category, headlines)
-    
+    fresh_data = fetch_categories(list(CATEGORIES.keys()), days=days)
     st.session_state.last_refresh = datetime.now()
     return fresh_data
 
 # ===========================================
 # Render Functions
 # ===========================================
-def render_headlines_list(headlines, limit=None):
-    """Render a list of headlines."""
-    display_headlines = headlines[:limit] if limit else headlines
-    for idx, headline in enumerate(display_headlines, 1):
-        with st.container():
-            st.markdown(f"**{idx}. {headline['title']}**")
-            source = headline.get('source', 'Unknown')
-            st.caption(f"📅 {headline['published']} • 📰 {source}")
-            st.markdown("")
-
+@st.fragment
 def render_category_tab(category: str):
-    """Render content for a single category tab."""
+    """
+    Render content for a single category tab.
+
+    Runs as a fragment so interactions inside the tab (e.g. generating a
+    summary) rerun only this tab instead of the whole app.
+    """
     data = st.session_state.category_data.get(category)
     
     if not data or not data.get('headlines'):
-        # No data yet - show loading state and fetch
+        # No data yet - load every missing category in one parallel batch
+        # so the remaining tabs don't each pay for a serial fetch
+        missing = [
+            cat for cat in CATEGORIES
+            if not st.session_state.category_data.get(cat, {}).get('headlines')
+        ]
         with st.spinner(f"Loading {category} news..."):
-            headlines = fetch_google_news(CATEGORIES[category], days=7, verbose=False)
-            if headlines:
-                st.session_state.category_data[category] = {
-                    'headlines': headlines,
-                    'summary': None,
-                    'timestamp': datetime.now().isoformat(),
-                    'num_articles': len(headlines)
-                }
-                save_category_to_cache(category, headlines)
-                data = st.session_state.category_data[category]
-            else:
-                st.warning(f"No news found for {category}. Try refreshing.")
-                return
+            fetch_categories(missing, days=7, cached=True)
+        data = st.session_state.category_data.get(category)
+        if not data or not data.get('headlines'):
+            st.warning(f"No news found for {category}. Try refreshing.")
+            return
     
     headlines = data['headlines']
     summary = data.get('summary')
@@ -147,7 +239,7 @@ def render_category_tab(category: str):
             if st.button(f"Generate Summary for {category}", key=f"summarize_{category}"):
                 try:
                     # Use st.write_stream for real-time streaming output
-                    summary = st.write_stream(summarize_headlines_stream(headlines))
+                    summary = st.write_stream(summarize_headlines_stream(compact_headlines(headlines)))
                     # Save the complete summary to session state and cache
                     st.session_state.category_data[category]['summary'] = summary
                     update_category_summary(category, summary)
@@ -193,8 +285,7 @@ def render_dashboard_card(category: str):
         
         if data and data.get('headlines'):
             headlines = data['headlines'][:5]  # Top 5 headlines
-            for headline in headlines:
-                st.markdown(f"• {headline['title'][:80]}{'...' if len(headline['title']) > 80 else ''}")
+            st.markdown("  \n".join(f"• {headline['title_80']}" for headline in headlines))
             
             st.caption(f"📰 {data['num_articles']} total articles")
         else:
@@ -202,22 +293,14 @@ def render_dashboard_card(category: str):
         
         st.markdown("---")
 
-def get_category_emoji(category: str) -> str:
-    """Get emoji for a category."""
-    emojis = {
-        "Tech": "💻",
-        "Business": "💼",
-        "Sports": "⚽",
-        "Entertainment": "🎬",
-        "Health": "🏥",
-        "Science": "🔬",
-        "Politics": "🏛️",
-        "World": "🌍"
-    }
-    return emojis.get(category, "📰")
-
+@st.fragment
 def render_custom_search_tab():
-    """Render custom search results in a tab."""
+    """
+    Render custom search results in a tab.
+
+    Runs as a fragment; only actions that add or remove the search tab
+    itself trigger a full app rerun.
+    """
     # Check if there's a pending search to execute
     if st.session_state.pending_search:
         pending = st.session_state.pending_search
@@ -237,14 +320,16 @@ def render_custom_search_tab():
         # Check cache first
         cached_search = get_search_by_query(query)
         if cached_search and cached_search.get('days') == days:
-            st.session_state.current_data = cached_search
+            st.session_state.current_data = add_query_labels(cached_search)
             st.session_state.pending_search = None
+            # Pending searches run during a full app run, where a
+            # fragment-scoped rerun is not allowed
             st.rerun()
             return
         
         # Fetch headlines
         with st.spinner(f'Fetching news for "{query}"...'):
-            headlines = fetch_google_news(query, days=days, verbose=False)
+            headlines = _call_cached(_cached_fetch, query, days)
         
         if not headlines:
             st.error(f"❌ No news found for '{query}'. Try a different search term.")
@@ -267,17 +352,21 @@ def render_custom_search_tab():
             st.subheader("🤖 AI Summary")
             st.markdown("---")
             try:
-                summary = st.write_stream(summarize_headlines_stream(headlines))
-                # Save to cache and session state
-                add_search_to_cache(query, days, headlines, summary)
-                st.session_state.current_data = {
+                # The search is cached once the summary has finished streaming
+                summary = st.write_stream(
+                    stream_search_to_cache(
+                        query, days, headlines, summarize_headlines_stream(compact_headlines(headlines))
+                    )
+                )
+                load_recent_searches.clear()
+                st.session_state.current_data = add_query_labels({
                     'query': query,
                     'days': days,
                     'headlines': headlines,
                     'summary': summary,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': time.time(),
                     'num_articles': len(headlines)
-                }
+                })
                 st.session_state.pending_search = None
             except Exception as e:
                 st.error(f"❌ Error generating summary: {str(e)}")
@@ -294,7 +383,7 @@ def render_custom_search_tab():
     # Header with clear button
     col_header, col_clear = st.columns([4, 1])
     with col_header:
-        search_date = datetime.fromisoformat(cached['timestamp'])
+        search_date = datetime.fromtimestamp(cached['timestamp'])
         formatted_date = search_date.strftime("%B %d, %Y at %I:%M %p")
         st.caption(f"🕐 Searched: {formatted_date}")
     with col_clear:
@@ -338,6 +427,26 @@ if st.sidebar.button("🔄 Refresh All Categories", type="primary", use_containe
         fetch_fresh_categories(days=7)
     st.rerun()
 
+# Summarize All button - every unsummarized category is summarized concurrently
+if st.sidebar.button("✨ Summarize All Categories", use_container_width=True):
+    pending = {
+        category: compact_headlines(data['headlines'])
+        for category, data in st.session_state.category_data.items()
+        if data.get('headlines') and not data.get('summary')
+    }
+    if pending:
+        try:
+            with st.spinner(f"Summarizing {len(pending)} categories..."):
+                summaries = asyncio.run(summarize_all(pending))
+            for category, summary in summaries.items():
+                st.session_state.category_data[category]['summary'] = summary
+                update_category_summary(category, summary)
+            st.rerun()
+        except Exception as e:
+            st.sidebar.error(f"❌ Error generating summaries: {str(e)}")
+    else:
+        st.sidebar.info("All loaded categories already have a summary")
+
 # Show last refresh time in sidebar
 if st.session_state.last_refresh:
     st.sidebar.caption(f"Last refresh: {st.session_state.last_refresh.strftime('%I:%M %p')}")
@@ -366,25 +475,34 @@ st.sidebar.markdown("---")
 
 # Recent Searches Section
 st.sidebar.header("📚 Recent Searches")
-recent_searches = get_recent_searches(limit=5)
+recent_searches = load_recent_searches(limit=5)
 
 if recent_searches:
     for idx, search in enumerate(recent_searches):
-        search_date = datetime.fromisoformat(search['timestamp'])
+        search_date = datetime.fromtimestamp(search['timestamp'])
         formatted_date = search_date.strftime("%b %d, %I:%M %p")
         
         if st.sidebar.button(
-            f"🔍 {search['query'][:25]}{'...' if len(search['query']) > 25 else ''}",
+            f"🔍 {search['query_25']}",
             key=f"recent_{idx}",
             help=f"{formatted_date} - {search['num_articles']} articles",
             use_container_width=True
         ):
-            st.session_state.current_data = search
+            search_data = get_search_by_query(search['query'])
+            if search_data:
+                st.session_state.current_data = add_query_labels(search_data)
+            else:
+                # Expired - search again with the same settings
+                st.session_state.pending_search = add_query_labels(
+                    {'query': search['query'], 'days': search['days']}
+                )
+                st.session_state.current_data = None
             st.rerun()
     
     if st.sidebar.button("🗑️ Clear History", use_container_width=True):
         clear_cache()
         clear_category_cache()
+        load_recent_searches.clear()
         st.session_state.current_data = None
         st.session_state.pending_search = None
         st.session_state.category_data = {}
@@ -401,20 +519,29 @@ if not st.session_state.fetch_triggered:
     # Load from cache first
     cached_categories = load_categories_from_cache()
     
-    # Only fetch fresh data if cache is empty or incomplete
-    if len(cached_categories) < len(CATEGORIES):
-        with st.spinner("📡 Fetching latest headlines from all categories..."):
-            fetch_fresh_categories(days=7)
-    else:
-        # Cache was valid, just set the last refresh time from cache
-        st.session_state.last_refresh = datetime.now()
+    # Expired entries are already dropped by the cache, so anything missing
+    # here is stale or was never fetched - fetch only those. A fetch of the
+    # same categories from the last 10 minutes (e.g. before Clear History)
+    # is reused; only Refresh All forces the network.
+    stale = [category for category in CATEGORIES if category not in cached_categories]
+    if stale:
+        with st.spinner(f"📡 Fetching latest headlines for {len(stale)} categories..."):
+            fetch_categories(stale, days=7, cached=True)
+    
+    # Report the age of the oldest data on screen, not the page load time
+    timestamps = [
+        datetime.fromtimestamp(data['timestamp'])
+        for data in st.session_state.category_data.values()
+        if data.get('timestamp')
+    ]
+    st.session_state.last_refresh = min(timestamps) if timestamps else None
 
 # ===========================================
 # Handle Custom Search
 # ===========================================
 if search_button and query:
     # Set pending search - actual search happens inside the tab
-    st.session_state.pending_search = {'query': query, 'days': days}
+    st.session_state.pending_search = add_query_labels({'query': query, 'days': days})
     st.session_state.current_data = None  # Clear any previous search
     st.rerun()
 
@@ -428,12 +555,10 @@ tab_names = ["📊 Dashboard"] + [f"{get_category_emoji(cat)} {cat}" for cat in
 # Add search tab if there's a pending or completed search
 has_search_tab = False
 if st.session_state.pending_search:
-    query = st.session_state.pending_search['query']
-    tab_names.append(f"🔍 {query[:20]}{'...' if len(query) > 20 else ''}")
+    tab_names.append(f"🔍 {st.session_state.pending_search['query_20']}")
     has_search_tab = True
 elif st.session_state.current_data:
-    query = st.session_state.current_data['query']
-    tab_names.append(f"🔍 {query[:20]}{'...' if len(query) > 20 else ''}")
+    tab_names.append(f"🔍 {st.session_state.current_data['query_20']}")
     has_search_tab = True
 
 tabs = st.tabs(tab_names)
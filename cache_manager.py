@@ -1,56 +1,239 @@
 """
 Cache manager for storing and retrieving search queries and results.
+
+Searches and categories are stored as one row each in a SQLite database, so
+adding, updating or looking up an entry touches that row only instead of
+rewriting the whole cache.
 """
 
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 import logging
 
-CACHE_FILE = "search_cache.json"
-CATEGORY_CACHE_FILE = "category_cache.json"
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: headlines are stored uncompressed without it
+    zstandard = None
+
+CACHE_DB_FILE = "cache.db"
+LEGACY_CACHE_FILE = "search_cache.json"  # JSON caches used by older versions
+LEGACY_CATEGORY_CACHE_FILE = "category_cache.json"
 MAX_CACHED_SEARCHES = 20
 CATEGORY_CACHE_TTL_MINUTES = 30  # Cache TTL for categories
+SEARCH_CACHE_TTL_MINUTES = 24 * 60  # Cached searches older than this are refetched
+MAX_MEMO_ENTRIES = 64  # Decoded query results kept in memory (LRU)
 
+# Searches are keyed by query.lower(), computed once on insert, so matching
+# is case-insensitive for non-ASCII letters too (COLLATE NOCASE only folds ASCII)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    query_lc TEXT PRIMARY KEY,
+    query TEXT,
+    days INTEGER,
+    ts REAL,
+    headlines BLOB,
+    summary TEXT,
+    num_articles INTEGER,
+    last_used REAL
+);
+CREATE INDEX IF NOT EXISTS searches_last_used ON searches (last_used);
+CREATE TABLE IF NOT EXISTS categories (
+    name TEXT PRIMARY KEY,
+    ts REAL,
+    headlines BLOB,
+    summary TEXT
+);
+"""
 
-def load_cache() -> List[Dict]:
-    """
-    Load cached searches from file.
+# One shared connection per process; the lock keeps multi-statement
+# operations from different Streamlit sessions from interleaving
+_conn: Optional[sqlite3.Connection] = None
+_db_lock = threading.RLock()
+
+# Decoded query results served from memory until the next write. Writes from
+# this process clear it directly; writes from other processes bump
+# PRAGMA data_version, which is checked before each memoized read.
+# Memoized dicts are shared across sessions, so public getters return
+# shallow copies; the headline lists inside them must not be mutated.
+_memo: "OrderedDict[tuple, object]" = OrderedDict()
+_memo_version: Optional[int] = None
+
+# zstd (de)compressor objects are not safe to share between threads
+_zstd = threading.local()
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _info_enabled() -> bool:
+    """Whether INFO records would be emitted; guards log formatting on read paths."""
+    return logging.getLogger().isEnabledFor(logging.INFO)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _pack_headlines(headlines: List[Dict]) -> bytes:
+    """Serialize headlines for a BLOB column, zstd-compressed when available."""
+    data = _dumps(headlines)
+    if zstandard is None:
+        return data
+    if not hasattr(_zstd, "compressor"):
+        _zstd.compressor = zstandard.ZstdCompressor(level=3)
+    return _zstd.compressor.compress(data)
+
+
+def _unpack_headlines(blob: bytes) -> List[Dict]:
+    """Inverse of _pack_headlines; also reads uncompressed rows."""
+    if blob[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("cached headlines are zstd-compressed but zstandard is not installed")
+        if not hasattr(_zstd, "decompressor"):
+            _zstd.decompressor = zstandard.ZstdDecompressor()
+        blob = _zstd.decompressor.decompress(blob)
+    return _loads(blob)
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database on first use, creating tables as needed."""
+    global _conn
     
-    Returns:
-        List of cached search dictionaries
-    """
-    if not os.path.exists(CACHE_FILE):
-        logging.info("cache_manager: No cache file found, returning empty list")
-        return []
+    with _db_lock:
+        if _conn is None:
+            conn = sqlite3.connect(CACHE_DB_FILE, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            _conn = conn
+            _migrate_legacy_caches(conn)
+        return _conn
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """Run several statements as one transaction (a single WAL commit)."""
+    with _db_lock:
+        conn = _get_connection()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        _invalidate_memo()
+
+
+def _memoized(key: tuple, load):
+    """Return load() for key, reusing the previous result until the database changes."""
+    global _memo_version
     
+    with _db_lock:
+        version = _get_connection().execute("PRAGMA data_version").fetchone()[0]
+        if version != _memo_version:
+            _memo.clear()
+            _memo_version = version
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+        
+        value = _memo[key] = load()
+        if len(_memo) > MAX_MEMO_ENTRIES:
+            _memo.popitem(last=False)
+        return value
+
+
+def _invalidate_memo() -> None:
+    """Forget memoized reads after this process writes to the database."""
+    with _db_lock:
+        _memo.clear()
+
+
+def _from_iso(timestamp_str: Optional[str]) -> float:
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-            logging.info(f"cache_manager: Loaded {len(cache)} cached searches")
-            return cache
-    except Exception as e:
-        logging.error(f"cache_manager: Error loading cache: {str(e)}")
-        return []
+        return datetime.fromisoformat(timestamp_str).timestamp()
+    except Exception:
+        return 0.0
 
 
-def save_cache(cache: List[Dict]) -> None:
-    """
-    Save cache to file.
+def _migrate_legacy_caches(conn: sqlite3.Connection) -> None:
+    """Import the JSON cache files written by older versions, then remove them."""
+    if os.path.exists(LEGACY_CACHE_FILE):
+        try:
+            with open(LEGACY_CACHE_FILE, 'rb') as f:
+                legacy = _loads(f.read())
+            for search in legacy[-MAX_CACHED_SEARCHES:]:
+                ts = _from_iso(search.get("timestamp"))
+                headlines = search.get("headlines", [])
+                conn.execute(
+                    "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (search.get("query", "").lower(), search.get("query", ""), search.get("days"), ts, _pack_headlines(headlines),
+                     search.get("summary"), len(headlines), ts)
+                )
+            os.remove(LEGACY_CACHE_FILE)
+            logging.info("cache_manager: Migrated %d searches from %s", len(legacy), LEGACY_CACHE_FILE)
+        except Exception as e:
+            logging.error("cache_manager: Error migrating legacy cache: %s", e)
     
-    Args:
-        cache: List of cached search dictionaries
-    """
-    try:
-        # Keep only the most recent MAX_CACHED_SEARCHES
-        cache = cache[-MAX_CACHED_SEARCHES:]
-        
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
-        logging.info(f"cache_manager: Saved {len(cache)} searches to cache")
-    except Exception as e:
-        logging.error(f"cache_manager: Error saving cache: {str(e)}")
+    if os.path.exists(LEGACY_CATEGORY_CACHE_FILE):
+        try:
+            with open(LEGACY_CATEGORY_CACHE_FILE, 'rb') as f:
+                legacy = _loads(f.read())
+            for category, data in legacy.items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO categories VALUES (?, ?, ?, ?)",
+                    (category, _from_iso(data.get("timestamp")),
+                     _pack_headlines(data.get("headlines", [])), data.get("summary"))
+                )
+            os.remove(LEGACY_CATEGORY_CACHE_FILE)
+            logging.info("cache_manager: Migrated %d categories from %s", len(legacy), LEGACY_CATEGORY_CACHE_FILE)
+        except Exception as e:
+            logging.error("cache_manager: Error migrating legacy category cache: %s", e)
+
+
+def _search_from_row(row: sqlite3.Row, with_payload: bool) -> Dict:
+    search = {
+        "query": row["query"],
+        "days": row["days"],
+        "timestamp": row["ts"],
+        "num_articles": row["num_articles"]
+    }
+    if with_payload:
+        search["headlines"] = _unpack_headlines(row["headlines"])
+        search["summary"] = row["summary"]
+    return search
+
+
+def _category_from_row(row: sqlite3.Row) -> Dict:
+    headlines = _unpack_headlines(row["headlines"])
+    return {
+        "headlines": headlines,
+        "summary": row["summary"],
+        "timestamp": row["ts"],
+        "num_articles": len(headlines)
+    }
 
 
 def add_search_to_cache(query: str, days: int, headlines: List[Dict], summary: str) -> None:
@@ -63,61 +246,130 @@ def add_search_to_cache(query: str, days: int, headlines: List[Dict], summary: s
         headlines: List of headlines
         summary: AI-generated summary
     """
-    cache = load_cache()
+    now = time.time()
+    try:
+        # Insert and eviction commit together, so a crash never leaves the
+        # table over its limit or the new search half-written
+        with _transaction() as conn:
+            # Replaces any existing search with the same query (case-insensitive)
+            conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (query.lower(), query, days, now, _pack_headlines(headlines), summary, len(headlines), now)
+            )
+            # Keep only the most recently used MAX_CACHED_SEARCHES
+            conn.execute(
+                "DELETE FROM searches WHERE query_lc NOT IN "
+                "(SELECT query_lc FROM searches ORDER BY last_used DESC LIMIT ?)",
+                (MAX_CACHED_SEARCHES,)
+            )
+        logging.info("cache_manager: Added search for '%s' to cache", query)
+    except Exception as e:
+        logging.error("cache_manager: Error saving search: %s", e)
+
+
+def stream_search_to_cache(query: str, days: int, headlines: List[Dict], chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Pass summary chunks through and cache the search once the stream ends.
     
-    # Create new search entry
-    search_entry = {
-        "query": query,
-        "days": days,
-        "timestamp": datetime.now().isoformat(),
-        "headlines": headlines,
-        "summary": summary,
-        "num_articles": len(headlines)
-    }
+    The search is written in a single insert after the last chunk; a stream
+    that is interrupted or fails leaves the cache untouched rather than
+    storing a truncated summary.
     
-    # Remove any existing search with the same query (to avoid duplicates)
-    cache = [s for s in cache if s.get("query", "").lower() != query.lower()]
+    Args:
+        query: Search query string
+        days: Number of days searched
+        headlines: List of headlines
+        chunks: Summary text chunks (e.g. from summarize_headlines_stream)
     
-    # Add new search at the end (most recent)
-    cache.append(search_entry)
+    Yields:
+        str: The same chunks, unchanged
+    """
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
     
-    logging.info(f"cache_manager: Added search for '{query}' to cache")
-    save_cache(cache)
+    add_search_to_cache(query, days, headlines, "".join(parts))
 
 
 def get_recent_searches(limit: int = 10) -> List[Dict]:
     """
     Get recent searches from cache.
     
+    Only metadata is returned; use get_search_by_query to load the headlines
+    and summary for a search.
+    
     Args:
         limit: Maximum number of searches to return
-        
+    
     Returns:
-        List of recent searches (most recent first)
+        List of recent search metadata (most recent first)
     """
-    cache = load_cache()
-    # Return in reverse order (most recent first)
-    return list(reversed(cache[-limit:]))
+    def load() -> List[Dict]:
+        rows = _get_connection().execute(
+            "SELECT query, days, ts, num_articles FROM searches ORDER BY ts DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+        return [_search_from_row(row, with_payload=False) for row in rows]
+    
+    try:
+        return [dict(search) for search in _memoized(("recent", limit), load)]
+    except Exception as e:
+        logging.error("cache_manager: Error loading recent searches: %s", e)
+        return []
 
 
-def get_search_by_query(query: str) -> Optional[Dict]:
+def get_search_by_query(query: str, ttl_minutes: int = SEARCH_CACHE_TTL_MINUTES) -> Optional[Dict]:
     """
     Get a specific search from cache by query.
     
+    A fresh hit also marks the search as recently used, so it survives
+    eviction ahead of searches that were never revisited.
+    
     Args:
         query: Search query string
-        
+        ttl_minutes: Maximum age of the cached search
+    
     Returns:
-        Search dictionary if found, None otherwise
+        Search dictionary (metadata plus headlines and summary) if found and
+        not expired, None otherwise
     """
-    cache = load_cache()
-    for search in reversed(cache):
-        if search.get("query", "").lower() == query.lower():
-            logging.info(f"cache_manager: Found cached search for '{query}'")
-            return search
+    query_lc = query.lower()
+    
+    def load() -> Optional[Dict]:
+        row = _get_connection().execute(
+            "SELECT * FROM searches WHERE query_lc = ?", (query_lc,)
+        ).fetchone()
+        return _search_from_row(row, with_payload=True) if row is not None else None
     
-    logging.info(f"cache_manager: No cached search found for '{query}'")
-    return None
+    try:
+        search = _memoized(("search", query_lc), load)
+    except Exception as e:
+        logging.error("cache_manager: Error loading search for '%s': %s", query, e)
+        return None
+    
+    if search is None:
+        if _info_enabled():
+            logging.info("cache_manager: No cached search found for '%s'", query)
+        return None
+    
+    if time.time() - search['timestamp'] > ttl_minutes * 60:
+        if _info_enabled():
+            logging.info("cache_manager: Cached search for '%s' expired", query)
+        return None
+    
+    try:
+        # last_used is not part of any memoized result, so the memo stays valid
+        with _db_lock:
+            _get_connection().execute(
+                "UPDATE searches SET last_used = ? WHERE query_lc = ?", (time.time(), query_lc)
+            )
+    except Exception as e:
+        logging.error("cache_manager: Error touching search '%s': %s", query, e)
+    
+    if _info_enabled():
+        logging.info("cache_manager: Found cached search for '%s'", query)
+    return dict(search)
 
 
 def clear_cache() -> None:
@@ -125,51 +377,25 @@ def clear_cache() -> None:
     Clear all cached searches.
     """
     try:
-        if os.path.exists(CACHE_FILE):
-            os.remove(CACHE_FILE)
-            logging.info("cache_manager: Cache cleared successfully")
+        with _db_lock:
+            _get_connection().execute("DELETE FROM searches")
+            _invalidate_memo()
+        logging.info("cache_manager: Cache cleared successfully")
     except Exception as e:
-        logging.error(f"cache_manager: Error clearing cache: {str(e)}")
+        logging.error("cache_manager: Error clearing cache: %s", e)
 
 
 # ============================================
 # Category-specific cache functions
 # ============================================
 
-def load_category_cache() -> Dict[str, Dict]:
-    """
-    Load category cache from file.
-    
-    Returns:
-        Dict mapping category name to cached data
-    """
-    if not os.path.exists(CATEGORY_CACHE_FILE):
-        logging.info("cache_manager: No category cache file found, returning empty dict")
-        return {}
+def _load_categories() -> Dict[str, Dict]:
+    """All cached categories, expired or not, decoded once per database change."""
+    def load() -> Dict[str, Dict]:
+        rows = _get_connection().execute("SELECT * FROM categories").fetchall()
+        return {row["name"]: _category_from_row(row) for row in rows}
     
-    try:
-        with open(CATEGORY_CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-            logging.info(f"cache_manager: Loaded category cache with {len(cache)} categories")
-            return cache
-    except Exception as e:
-        logging.error(f"cache_manager: Error loading category cache: {str(e)}")
-        return {}
-
-
-def save_category_cache(cache: Dict[str, Dict]) -> None:
-    """
-    Save category cache to file.
-    
-    Args:
-        cache: Dict mapping category name to cached data
-    """
-    try:
-        with open(CATEGORY_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
-        logging.info(f"cache_manager: Saved category cache with {len(cache)} categories")
-    except Exception as e:
-        logging.error(f"cache_manager: Error saving category cache: {str(e)}")
+    return _memoized(("categories",), load)
 
 
 def get_category_from_cache(category: str) -> Optional[Dict]:
@@ -178,26 +404,31 @@ def get_category_from_cache(category: str) -> Optional[Dict]:
     
     Args:
         category: Category name (e.g., "Tech", "Business")
-        
+    
     Returns:
-        Dict with keys: headlines, summary (optional), timestamp, num_articles
+        Dict with keys: headlines, summary (optional), timestamp (Unix seconds), num_articles
         Returns None if not found or expired
     """
-    cache = load_category_cache()
-    
-    if category not in cache:
-        logging.info(f"cache_manager: Category '{category}' not found in cache")
+    try:
+        cached_data = _load_categories().get(category)
+    except Exception as e:
+        logging.error("cache_manager: Error loading category '%s': %s", category, e)
         return None
     
-    cached_data = cache[category]
+    if cached_data is None:
+        if _info_enabled():
+            logging.info("cache_manager: Category '%s' not found in cache", category)
+        return None
     
     # Check if cache is expired
-    if is_category_cache_expired(cached_data.get('timestamp')):
-        logging.info(f"cache_manager: Category '{category}' cache expired")
+    if is_category_cache_expired(cached_data['timestamp']):
+        if _info_enabled():
+            logging.info("cache_manager: Category '%s' cache expired", category)
         return None
     
-    logging.info(f"cache_manager: Found valid cache for category '{category}'")
-    return cached_data
+    if _info_enabled():
+        logging.info("cache_manager: Found valid cache for category '%s'", category)
+    return dict(cached_data)
 
 
 def save_category_to_cache(category: str, headlines: List[Dict], summary: Optional[str] = None) -> None:
@@ -209,17 +440,44 @@ def save_category_to_cache(category: str, headlines: List[Dict], summary: Option
         headlines: List of headline dictionaries
         summary: AI-generated summary (optional, can be added later)
     """
-    cache = load_category_cache()
+    try:
+        with _db_lock:
+            _get_connection().execute(
+                "INSERT OR REPLACE INTO categories VALUES (?, ?, ?, ?)",
+                (category, time.time(), _pack_headlines(headlines), summary)
+            )
+            _invalidate_memo()
+        logging.info("cache_manager: Saved category '%s' with %d headlines to cache", category, len(headlines))
+    except Exception as e:
+        logging.error("cache_manager: Error saving category '%s': %s", category, e)
+
+
+def save_categories_to_cache(categories_headlines: Dict[str, List[Dict]]) -> None:
+    """
+    Save several categories to cache in a single transaction.
     
-    cache[category] = {
-        "headlines": headlines,
-        "summary": summary,
-        "timestamp": datetime.now().isoformat(),
-        "num_articles": len(headlines)
-    }
+    A full refresh writes every category at once, so this commits once
+    instead of once per category.
+    
+    Args:
+        categories_headlines: Dict mapping category name to its headlines
+    """
+    if not categories_headlines:
+        return
     
-    logging.info(f"cache_manager: Saved category '{category}' with {len(headlines)} headlines to cache")
-    save_category_cache(cache)
+    now = time.time()
+    try:
+        with _transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO categories VALUES (?, ?, ?, NULL)",
+                [
+                    (category, now, _pack_headlines(headlines))
+                    for category, headlines in categories_headlines.items()
+                ]
+            )
+        logging.info("cache_manager: Saved %d categories to cache", len(categories_headlines))
+    except Exception as e:
+        logging.error("cache_manager: Error saving categories: %s", e)
 
 
 def update_category_summary(category: str, summary: str) -> None:
@@ -230,36 +488,42 @@ def update_category_summary(category: str, summary: str) -> None:
         category: Category name
         summary: AI-generated summary
     """
-    cache = load_category_cache()
+    try:
+        with _db_lock:
+            updated = _get_connection().execute(
+                "UPDATE categories SET summary = ? WHERE name = ?", (summary, category)
+            ).rowcount
+            # Patch the memoized row instead of dropping every decoded category
+            memoized = _memo.get(("categories",))
+            if memoized is not None and category in memoized:
+                memoized[category] = dict(memoized[category], summary=summary)
+    except Exception as e:
+        logging.error("cache_manager: Error updating summary for '%s': %s", category, e)
+        return
     
-    if category in cache:
-        cache[category]["summary"] = summary
-        save_category_cache(cache)
-        logging.info(f"cache_manager: Updated summary for category '{category}'")
+    if updated:
+        logging.info("cache_manager: Updated summary for category '%s'", category)
     else:
-        logging.warning(f"cache_manager: Cannot update summary - category '{category}' not in cache")
+        logging.warning("cache_manager: Cannot update summary - category '%s' not in cache", category)
 
 
-def is_category_cache_expired(timestamp_str: Optional[str]) -> bool:
+def is_category_cache_expired(timestamp: Optional[Union[float, str]]) -> bool:
     """
     Check if a category cache entry is expired.
     
     Args:
-        timestamp_str: ISO format timestamp string
-        
+        timestamp: Unix timestamp in seconds (ISO format strings from older
+            versions are still accepted)
+    
     Returns:
         True if expired or invalid, False if still valid
     """
-    if not timestamp_str:
+    if isinstance(timestamp, str):
+        timestamp = _from_iso(timestamp)
+    if not timestamp:
         return True
     
-    try:
-        cached_time = datetime.fromisoformat(timestamp_str)
-        expiry_time = cached_time + timedelta(minutes=CATEGORY_CACHE_TTL_MINUTES)
-        is_expired = datetime.now() > expiry_time
-        return is_expired
-    except Exception:
-        return True
+    return time.time() - timestamp > CATEGORY_CACHE_TTL_MINUTES * 60
 
 
 def get_all_categories_from_cache() -> Dict[str, Dict]:
@@ -269,14 +533,20 @@ def get_all_categories_from_cache() -> Dict[str, Dict]:
     Returns:
         Dict mapping category name to cached data (only non-expired entries)
     """
-    cache = load_category_cache()
-    valid_cache = {}
+    try:
+        all_categories = _load_categories()
+    except Exception as e:
+        logging.error("cache_manager: Error loading categories: %s", e)
+        return {}
     
-    for category, data in cache.items():
-        if not is_category_cache_expired(data.get('timestamp')):
-            valid_cache[category] = data
+    valid_cache = {
+        category: dict(data)
+        for category, data in all_categories.items()
+        if not is_category_cache_expired(data['timestamp'])
+    }
     
-    logging.info(f"cache_manager: Retrieved {len(valid_cache)} valid categories from cache")
+    if _info_enabled():
+        logging.info("cache_manager: Retrieved %d valid categories from cache", len(valid_cache))
     return valid_cache
 
 
@@ -285,8 +555,10 @@ def clear_category_cache() -> None:
     Clear all category cache.
     """
     try:
-        if os.path.exists(CATEGORY_CACHE_FILE):
-            os.remove(CATEGORY_CACHE_FILE)
-            logging.info("cache_manager: Category cache cleared successfully")
+        with _db_lock:
+            _get_connection().execute("DELETE FROM categories")
+            _invalidate_memo()
+        logging.info("cache_manager: Category cache cleared successfully")
     except Exception as e:
-        logging.error(f"cache_manager: Error clearing category cache: {str(e)}")
+        logging.error("cache_manager: Error clearing category cache: %s", e)
+
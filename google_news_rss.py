@@ -1,12 +1,48 @@
-import feedparser
+import asyncio
+import aiohttp
+from io import BytesIO
+from lxml import etree
 from urllib.parse import quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 import time
 import logging
+import threading
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def fetch_google_news(query, days=7, verbose=False):
+# Shared session so concurrent and repeated fetches reuse keep-alive
+# connections to news.google.com instead of a new TLS handshake each time
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Headlines fetched in the last minute, keyed by (query, days), so reruns and
+# duplicate requests don't hit Google News again. Only non-empty results are
+# stored; errors and empty feeds are retried on the next call. Callers modify
+# the headline dicts they get back, so copies go in and out.
+_rss_memo = TTLCache(maxsize=128, ttl=60)
+_rss_memo_lock = threading.Lock()
+
+def _get_memoized(query, days):
+    """Return headlines fetched for (query, days) within the TTL, or None."""
+    with _rss_memo_lock:
+        headlines = _rss_memo.get((query, days))
+    return [dict(headline) for headline in headlines] if headlines is not None else None
+
+def _memoize(query, days, headlines):
+    """Remember a successful, non-empty fetch for (query, days)."""
+    if headlines:
+        copies = [dict(headline) for headline in headlines]
+        with _rss_memo_lock:
+            _rss_memo[(query, days)] = copies
+
+def fetch_google_news(query, days=7, verbose=False, refresh=False):
     """
     Fetch Google News headlines for a given search query
     
@@ -14,6 +50,7 @@ def fetch_google_news(query, days=7, verbose=False):
         query (str): Search query string
         days (int): Number of days to look back (default: 7)
         verbose (bool): Whether to print results (default: True)
+        refresh (bool): Skip the one-minute memo and always fetch (default: False)
         
     Returns:
         list: List of dictionaries containing 'title' and 'published' keys,
@@ -31,60 +68,140 @@ def fetch_google_news(query, days=7, verbose=False):
 
     https://news.google.com/rss/search?q=technologie&hl=fr-CA&gl=CA&ceid=CA:fr
     """
-    rss_url = f"https://news.google.com/rss/search?q={quote(query)}+when:{days}d"
-    logging.info(f"fetch_google_news: Constructed RSS URL: {rss_url}")
+    rss_url = build_rss_url(query, days)
+    logging.info("fetch_google_news: Constructed RSS URL: %s", rss_url)
     
     if verbose:
         print(f'\nFetching news for: "{query}" (Last {days} days)...\n')
     
     try:
-        logging.info("fetch_google_news: Fetching RSS feed with timeout")
-        # Fetch RSS feed with a timeout to prevent hanging
-        response = requests.get(rss_url, timeout=10)
-        response.raise_for_status()
-        logging.info(f"fetch_google_news: RSS feed fetched successfully (status: {response.status_code})")
-        
-        logging.info("fetch_google_news: Parsing RSS feed with feedparser")
-        feed = feedparser.parse(response.content)
-        logging.info(f"fetch_google_news: feedparser.parse() completed")
-        
-        total_articles = len(feed.entries)
-        logging.info(f"fetch_google_news: Found {total_articles} entries in feed")
+        headlines = None if refresh else _get_memoized(query, days)
+        if headlines is None:
+            logging.info("fetch_google_news: Fetching RSS feed with timeout")
+            # Fetch RSS feed with a timeout to prevent hanging
+            # Stream the body straight into the parser instead of buffering it
+            response = _session.get(rss_url, timeout=10, stream=True)
+            try:
+                response.raise_for_status()
+                logging.info("fetch_google_news: RSS feed fetched successfully (status: %s)", response.status_code)
+                
+                response.raw.decode_content = True
+                headlines = parse_headlines(response.raw)
+            finally:
+                response.close()
+            _memoize(query, days, headlines)
         
-        if total_articles == 0:
-            logging.info("fetch_google_news: No articles found")
+        if not headlines:
             if verbose:
                 print(f'No news found for "{query}".')
             return []
         
         if verbose:
-            print(f'✅ Found {total_articles} articles for "{query}".\n')
+            print(f'✅ Found {len(headlines)} articles for "{query}".\n')
+            for index, headline in enumerate(headlines, 1):
+                print(f'{index}. {headline["title"]}')
+                print(f'   📅 Published: {headline["published"]}')
+                print(f'   📰 Source: {headline["source"]}\n')
         
-        # Collect articles data
-        logging.info("fetch_google_news: Starting to collect article data")
-        headlines = []
-        for index, item in enumerate(feed.entries, 1):
-            headline_data = {
-                'title': item.title,
-                'published': item.published,
-                'source': item.source.title
-            }
-            headlines.append(headline_data)
-            
-            if verbose:
-                print(f'{index}. {item.title}')
-                print(f'   📅 Published: {item.published}')
-                print(f'   📰 Source: {item.source.title}\n')
-        
-        logging.info(f"fetch_google_news: Collected {len(headlines)} headlines, returning")
+        logging.info("fetch_google_news: Collected %d headlines, returning", len(headlines))
         return headlines
         
     except Exception as error:
-        logging.error(f'fetch_google_news: Exception occurred: {str(error)}', exc_info=True)
+        logging.error("fetch_google_news: Exception occurred: %s", error, exc_info=True)
         if verbose:
             print(f'Error fetching news for "{query}": {str(error)}')
         return []
 
+def build_rss_url(query, days=7):
+    """
+    Build the Google News RSS search URL for a query.
+    
+    Args:
+        query (str): Search query string
+        days (int): Number of days to look back
+        
+    Returns:
+        str: RSS feed URL
+    """
+    return f"https://news.google.com/rss/search?q={quote(query)}+when:{days}d"
+
+def parse_headlines(content):
+    """
+    Parse raw RSS bytes into headline dictionaries.
+    
+    Args:
+        content (bytes or file-like): RSS feed body, or a binary stream
+            yielding it (e.g. a streamed response's raw body)
+        
+    Returns:
+        list: List of dictionaries with 'title', 'published' and 'source' keys;
+            items without a title are skipped
+    """
+    headlines = []
+    
+    # Stream over <item> elements only, reading just the three fields we use
+    if isinstance(content, bytes):
+        content = BytesIO(content)
+    
+    # Remote input: never expand entities or fetch external resources, and
+    # recover from markup errors such as undeclared HTML entities (&nbsp;)
+    # instead of dropping the whole feed
+    for _, item in etree.iterparse(
+        content, tag='item', resolve_entities=False, no_network=True, recover=True
+    ):
+        title = item.findtext('title')
+        if title:
+            headlines.append({
+                'title': title,
+                'published': item.findtext('pubDate') or '',
+                'source': item.findtext('source') or ''
+            })
+        item.clear()
+    
+    logging.info("parse_headlines: Found %d entries in feed", len(headlines))
+    return headlines
+
+async def fetch_google_news_async(query, days=7, session=None, refresh=False):
+    """
+    Fetch Google News headlines for a query without blocking the event loop.
+    
+    Args:
+        query (str): Search query string
+        days (int): Number of days to look back (default: 7)
+        session (aiohttp.ClientSession): Shared session to reuse; a private
+            one is opened and closed when omitted
+        refresh (bool): Skip the one-minute memo and always fetch (default: False)
+        
+    Returns:
+        list: Same shape as fetch_google_news, or empty list on error
+    """
+    if session is None:
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16)) as own_session:
+            return await fetch_google_news_async(query, days, own_session, refresh)
+    
+    headlines = None if refresh else _get_memoized(query, days)
+    if headlines is not None:
+        return headlines
+    
+    rss_url = build_rss_url(query, days)
+    logging.info("fetch_google_news_async: Fetching %s", rss_url)
+    
+    try:
+        async with session.get(rss_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+            content = await response.read()
+        
+        # Parsing is CPU-bound; keep it off the event loop so other feeds keep downloading
+        loop = asyncio.get_running_loop()
+        headlines = await loop.run_in_executor(None, parse_headlines, content)
+        logging.info("fetch_google_news_async: Collected %d headlines for '%s'", len(headlines), query)
+        _memoize(query, days, headlines)
+        return headlines
+        
+    except Exception as error:
+        logging.error('fetch_google_news_async: Exception occurred for "%s": %s', query, error, exc_info=True)
+        return []
+
 def fetch_multiple_news():
     """
     Fetch news for multiple predefined queries concurrently
@@ -112,43 +229,50 @@ def fetch_multiple_news():
     with ThreadPoolExecutor(max_workers=5) as executor:
         executor.map(lambda q: fetch_google_news(q, days), queries)
 
-def fetch_all_categories(categories: Dict[str, str], days: int = 7) -> Dict[str, List[Dict]]:
+def fetch_all_categories(categories: Dict[str, str], days: int = 7, refresh: bool = False) -> Dict[str, List[Dict]]:
     """
-    Fetch news for all categories in parallel.
+    Fetch news for all categories concurrently.
+    
+    Blocking wrapper around fetch_all_categories_async for callers without
+    an event loop of their own.
     
     Args:
         categories: Dict mapping category name to search query
                    e.g., {"Tech": "technology news", "Business": "business news"}
         days: Number of days to look back (default: 7)
+        refresh: Skip the one-minute memo and always fetch (default: False)
         
     Returns:
         Dict mapping category name to list of headlines
         e.g., {"Tech": [{"title": "...", "published": "...", "source": "..."}]}
     """
-    results = {}
-    logging.info(f"fetch_all_categories: Starting parallel fetch for {len(categories)} categories")
-    
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        # Submit all fetch tasks
-        future_to_category = {
-            executor.submit(fetch_google_news, query, days, False): category
-            for category, query in categories.items()
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_category):
-            category = future_to_category[future]
-            try:
-                headlines = future.result()
-                results[category] = headlines
-                logging.info(f"fetch_all_categories: {category} completed with {len(headlines)} headlines")
-            except Exception as e:
-                logging.error(f"fetch_all_categories: {category} failed with error: {str(e)}")
-                results[category] = []  # Empty list on error
-    
-    logging.info(f"fetch_all_categories: All categories fetched. Total: {sum(len(h) for h in results.values())} headlines")
+    logging.info("fetch_all_categories: Starting concurrent fetch for %d categories", len(categories))
+    results = asyncio.run(fetch_all_categories_async(categories, days, refresh))
+    logging.info("fetch_all_categories: All categories fetched. Total: %d headlines", sum(len(h) for h in results.values()))
     return results
 
+async def fetch_all_categories_async(categories: Dict[str, str], days: int = 7, refresh: bool = False) -> Dict[str, List[Dict]]:
+    """
+    Fetch news for all categories concurrently on a single event loop.
+    
+    Args:
+        categories: Dict mapping category name to search query
+        days: Number of days to look back (default: 7)
+        refresh: Skip the one-minute memo and always fetch (default: False)
+        
+    Returns:
+        Dict mapping category name to list of headlines (empty list on error)
+    """
+    logging.info("fetch_all_categories_async: Starting concurrent fetch for %d categories", len(categories))
+    
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16)) as session:
+        results = await asyncio.gather(*[
+            fetch_google_news_async(query, days, session, refresh)
+            for query in categories.values()
+        ])
+    
+    return dict(zip(categories.keys(), results))
+
 
 if __name__ == "__main__":
     # fetch_multiple_news()
@@ -0,0 +1,44 @@
+"""
+Shared Streamlit UI helpers for the Headlines.AI app.
+"""
+
+import streamlit as st
+
+CATEGORY_EMOJIS = {
+    "Tech": "💻",
+    "Business": "💼",
+    "Sports": "⚽",
+    "Entertainment": "🎬",
+    "Health": "🏥",
+    "Science": "🔬",
+    "Politics": "🏛️",
+    "World": "🌍"
+}
+
+
+def init_session_state():
+    """Initialize session state keys on the first run of a session."""
+    if 'current_data' not in st.session_state:
+        st.session_state.current_data = None  # Custom search data (shown as dynamic tab)
+    if 'pending_search' not in st.session_state:
+        st.session_state.pending_search = None  # {query, days} - triggers search inside tab
+    if 'category_data' not in st.session_state:
+        st.session_state.category_data = {}  # {category: {headlines, summary, timestamp}}
+    if 'fetch_triggered' not in st.session_state:
+        st.session_state.fetch_triggered = False
+    if 'last_refresh' not in st.session_state:
+        st.session_state.last_refresh = None
+
+
+def get_category_emoji(category: str) -> str:
+    """Get emoji for a category."""
+    return CATEGORY_EMOJIS.get(category, "📰")
+
+
+def render_headlines_list(headlines, limit=None):
+    """Render a list of headlines as a single markdown element."""
+    display_headlines = headlines[:limit] if limit else headlines
+    st.markdown("\n\n".join(
+        f"**{idx}. {headline['title']}**  \n📅 {headline['published']} • 📰 {headline.get('source', 'Unknown')}"
+        for idx, headline in enumerate(display_headlines, 1)
+    ))
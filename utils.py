@@ -2,20 +2,69 @@
 Utility functions for the handson.ai application.
 """
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
+import asyncio
+import functools
 import os
 import logging
+from string import Template
 
 load_dotenv()
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+SUMMARY_MODEL = "nvidia/nemotron-3-nano-30b-a3b:free"
+SUMMARY_EXTRA_BODY = {"reasoning": {"enabled": True}}
 
-def get_openrouter_client():
+_PROMPT_TEMPLATE = Template("""Analyze and summarize the following news headlines. Provide a concise summary that:
+1. Identifies the main themes and topics
+2. Highlights any significant trends or patterns
+3. Notes any breaking or urgent news
+4. Provides context and insights
+
+Headlines:
+$headlines
+
+Provide a clear, well-structured summary.""")
+
+
+def truncate_text(text, length):
     """
-    Returns a configured OpenAI client for OpenRouter API.
+    Shorten text to a display label.
     
+    Args:
+        text (str): Text to shorten
+        length (int): Maximum number of characters kept before the ellipsis
+        
     Returns:
-        OpenAI: Configured client with OpenRouter base URL and API key
+        str: text unchanged if short enough, otherwise its first `length`
+            characters followed by '...'
+    """
+    return f"{text[:length]}..." if len(text) > length else text
+
+
+def compact_headlines(headlines):
+    """
+    Project headlines down to the fields the summarization prompt uses.
+    
+    Google News titles already end with the publisher name, so dates and
+    source metadata only add prompt tokens.
+    
+    Args:
+        headlines (list): Headline dictionaries as returned by fetch_google_news
+        
+    Returns:
+        list: List of dictionaries with only a 'title' key
+    """
+    return [{'title': headline['title']} for headline in headlines]
+
+
+def _openrouter_settings():
+    """
+    Connection settings shared by the sync and async OpenRouter clients.
+    
+    Returns:
+        dict: base_url and api_key keyword arguments for OpenAI/AsyncOpenAI
         
     Raises:
         ValueError: If OPENROUTER_API_KEY is not found in environment variables
@@ -25,18 +74,87 @@ def get_openrouter_client():
     if not api_key:
         raise ValueError("OPENROUTER_API_KEY not found in environment variables")
     
-    return OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
+    return {"base_url": OPENROUTER_BASE_URL, "api_key": api_key}
+
+
+@functools.lru_cache(maxsize=1)
+def get_openrouter_client():
+    """
+    Returns a configured OpenAI client for OpenRouter API.
+    
+    The client is created once per process and shared, so its HTTP
+    connection pool is reused across summarization calls.
+    
+    Returns:
+        OpenAI: Configured client with OpenRouter base URL and API key
+        
+    Raises:
+        ValueError: If OPENROUTER_API_KEY is not found in environment variables
+    """
+    return OpenAI(**_openrouter_settings())
+
+
+def get_openrouter_async_client():
+    """
+    Returns a configured AsyncOpenAI client for OpenRouter API.
+    
+    Unlike get_openrouter_client this is not shared: the client's connection
+    pool is tied to the event loop it is used on, so create one per
+    asyncio.run() and close it when done (e.g. with `async with`).
+    
+    Returns:
+        AsyncOpenAI: Configured client with OpenRouter base URL and API key
+        
+    Raises:
+        ValueError: If OPENROUTER_API_KEY is not found in environment variables
+    """
+    return AsyncOpenAI(**_openrouter_settings())
+
+
+def _build_prompt(headlines):
+    """
+    Build the summarization prompt for a list of headlines.
+    
+    Args:
+        headlines (list): List of dictionaries with a 'title' key
+        
+    Returns:
+        str: Prompt text shared by all summarize functions
+    """
+    return _PROMPT_TEMPLATE.substitute(
+        headlines="\n".join(f"- {item['title']}" for item in headlines)
     )
 
 
+def _completion_request(prompt):
+    """
+    Build the chat completion arguments shared by every summarize function.
+    
+    Args:
+        prompt (str): Prompt text (see _build_prompt)
+        
+    Returns:
+        dict: Keyword arguments for client.chat.completions.create
+    """
+    return {
+        "model": SUMMARY_MODEL,
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "extra_body": SUMMARY_EXTRA_BODY
+    }
+
+
 def summarize_headlines(headlines):
     """
     Summarize a list of news headlines using NVIDIA Nemotron via OpenRouter.
     
     Args:
-        headlines (list): List of dictionaries with 'title' and 'published' keys
+        headlines (list): List of dictionaries with a 'title' key
+            (see compact_headlines)
         
     Returns:
         str: AI-generated summary of the headlines
@@ -44,57 +162,30 @@ def summarize_headlines(headlines):
     Raises:
         ValueError: If OPENROUTER_API_KEY is not found or API call fails
     """
-    logging.info(f"summarize_headlines: Starting with {len(headlines)} headlines")
+    logging.info("summarize_headlines: Starting with %d headlines", len(headlines))
     
     if not headlines:
         logging.info("summarize_headlines: No headlines provided")
         return "No headlines to summarize."
     
-    # Format headlines into a readable text
-    logging.info("summarize_headlines: Formatting headlines into text")
-    headlines_text = "\n".join([
-        f"- {item['title']} (Published: {item['published']})"
-        for item in headlines
-    ])
-    
-    # Create prompt for summarization
-    prompt = f"""Analyze and summarize the following news headlines. Provide a concise summary that:
-1. Identifies the main themes and topics
-2. Highlights any significant trends or patterns
-3. Notes any breaking or urgent news
-4. Provides context and insights
-
-Headlines:
-{headlines_text}
-
-Provide a clear, well-structured summary."""
-    
-    logging.info(f"summarize_headlines: Prompt created (length: {len(prompt)} chars)")
+    prompt = _build_prompt(headlines)
+    logging.info("summarize_headlines: Prompt created (length: %d chars)", len(prompt))
     
     try:
         logging.info("summarize_headlines: Getting OpenRouter client")
         client = get_openrouter_client()
         
-        logging.info("summarize_headlines: Calling OpenRouter API with nvidia/nemotron-3-nano-30b-a3b:free")
-        response = client.chat.completions.create(
-            model="nvidia/nemotron-3-nano-30b-a3b:free",
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            extra_body={"reasoning": {"enabled": True}}
-        )
+        logging.info("summarize_headlines: Calling OpenRouter API with %s", SUMMARY_MODEL)
+        response = client.chat.completions.create(**_completion_request(prompt))
         
         logging.info("summarize_headlines: API call successful, extracting response")
         summary = response.choices[0].message.content
-        logging.info(f"summarize_headlines: Summary generated (length: {len(summary)} chars)")
+        logging.info("summarize_headlines: Summary generated (length: %d chars)", len(summary))
         
         return summary
         
     except Exception as e:
-        logging.error(f"summarize_headlines: Exception occurred: {str(e)}", exc_info=True)
+        logging.error("summarize_headlines: Exception occurred: %s", e, exc_info=True)
         raise ValueError(f"Error generating summary: {str(e)}")
 
 
@@ -106,7 +197,8 @@ def summarize_headlines_stream(headlines):
     real-time streaming to the Streamlit frontend.
     
     Args:
-        headlines (list): List of dictionaries with 'title' and 'published' keys
+        headlines (list): List of dictionaries with a 'title' key
+            (see compact_headlines)
         
     Yields:
         str: Chunks of AI-generated summary text
@@ -114,46 +206,20 @@ def summarize_headlines_stream(headlines):
     Raises:
         ValueError: If OPENROUTER_API_KEY is not found or API call fails
     """
-    logging.info(f"summarize_headlines_stream: Starting with {len(headlines)} headlines")
+    logging.info("summarize_headlines_stream: Starting with %d headlines", len(headlines))
     
     if not headlines:
         logging.info("summarize_headlines_stream: No headlines provided")
         yield "No headlines to summarize."
         return
     
-    # Format headlines into a readable text
-    headlines_text = "\n".join([
-        f"- {item['title']} (Published: {item['published']})"
-        for item in headlines
-    ])
-    
-    # Create prompt for summarization
-    prompt = f"""Analyze and summarize the following news headlines. Provide a concise summary that:
-1. Identifies the main themes and topics
-2. Highlights any significant trends or patterns
-3. Notes any breaking or urgent news
-4. Provides context and insights
-
-Headlines:
-{headlines_text}
-
-Provide a clear, well-structured summary."""
+    prompt = _build_prompt(headlines)
     
     try:
         client = get_openrouter_client()
         
         logging.info("summarize_headlines_stream: Starting streaming API call")
-        stream = client.chat.completions.create(
-            model="nvidia/nemotron-3-nano-30b-a3b:free",
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            stream=True,
-            extra_body={"reasoning": {"enabled": True}}
-        )
+        stream = client.chat.completions.create(**_completion_request(prompt), stream=True)
         
         # Yield chunks as they arrive
         for chunk in stream:
@@ -165,5 +231,70 @@ Provide a clear, well-structured summary."""
         logging.info("summarize_headlines_stream: Streaming completed")
         
     except Exception as e:
-        logging.error(f"summarize_headlines_stream: Exception occurred: {str(e)}", exc_info=True)
+        logging.error("summarize_headlines_stream: Exception occurred: %s", e, exc_info=True)
         raise ValueError(f"Error generating summary: {str(e)}")
+
+
+async def summarize_headlines_async(client, headlines):
+    """
+    Summarize a list of news headlines without blocking the event loop.
+    
+    Args:
+        client (AsyncOpenAI): Client from get_openrouter_async_client
+        headlines (list): List of dictionaries with a 'title' key
+            (see compact_headlines)
+        
+    Returns:
+        str: AI-generated summary of the headlines
+    """
+    if not headlines:
+        return "No headlines to summarize."
+    
+    response = await client.chat.completions.create(**_completion_request(_build_prompt(headlines)))
+    return response.choices[0].message.content
+
+
+async def summarize_all(categories_headlines):
+    """
+    Summarize several categories of headlines concurrently.
+    
+    Each category gets its own API call; all calls share one client and run
+    at the same time, so the total wait is roughly that of the slowest call.
+    
+    Args:
+        categories_headlines (dict): Category name -> list of dictionaries
+            with a 'title' key (see compact_headlines)
+        
+    Returns:
+        dict: Category name -> AI-generated summary. Categories whose call
+            failed are omitted.
+        
+    Raises:
+        ValueError: If OPENROUTER_API_KEY is not found or every call fails
+    """
+    logging.info("summarize_all: Starting with %d categories", len(categories_headlines))
+    
+    if not categories_headlines:
+        return {}
+    
+    async with get_openrouter_async_client() as client:
+        results = await asyncio.gather(
+            *[
+                summarize_headlines_async(client, headlines)
+                for headlines in categories_headlines.values()
+            ],
+            return_exceptions=True
+        )
+    
+    summaries = {}
+    for category, result in zip(categories_headlines, results):
+        if isinstance(result, Exception):
+            logging.error("summarize_all: %s failed: %s", category, result)
+        else:
+            summaries[category] = result
+    
+    if not summaries:
+        raise ValueError(f"Error generating summaries: {str(results[0])}")
+    
+    logging.info("summarize_all: Summaries generated for %d categories", len(summaries))
+    return summaries